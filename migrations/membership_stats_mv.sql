@@ -0,0 +1,29 @@
+-- Admin "Member Count by Membership Type" reads this instead of scanning member twice per load.
+-- Runs with search_path set to the configured schema.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_membership_stats AS
+SELECT
+    membership_type,
+    COUNT(*) AS member_count,
+    ROUND(COUNT(*)*100.0/(SELECT COUNT(*) FROM member), 1) AS percentage
+FROM member
+GROUP BY membership_type;
+
+-- Required for REFRESH ... CONCURRENTLY (readers are never blocked)
+CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_membership_stats_type
+    ON mv_membership_stats (membership_type);
+
+-- The dashboard refreshes the view itself (refresh_materialized_view, every 5 min);
+-- with pg_cron installed it is also refreshed when nobody has the dashboard open
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.schedule(
+            'refresh_mv_membership_stats',
+            '*/5 * * * *',
+            -- pg_cron sessions use the default search_path, so qualify the view here
+            format('REFRESH MATERIALIZED VIEW CONCURRENTLY %I.mv_membership_stats', current_schema())
+        );
+    END IF;
+END
+$$;
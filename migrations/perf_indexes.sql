@@ -0,0 +1,15 @@
+-- Composite indexes backing the dashboard queries (applied on first connection).
+-- Runs with search_path set to the configured schema.
+
+-- Trainer: my scheduled sessions (filter trainer_id + training_date range, ordered by date/time)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_personal_training_trainer_date
+    ON personal_training (trainer_id, training_date, start_time);
+
+-- Member: my personal training records (filter member_id, ordered by training_date)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_personal_training_member_date
+    ON personal_training (member_id, training_date);
+
+-- Member: workout history / Trainer: average duration by equipment type (filter member_id + start_time)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_workout_record_member_start
+    ON workout_record (member_id, start_time)
+    INCLUDE (equipment_id, duration_minutes, calories_burned, heart_rate_avg);